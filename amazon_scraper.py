@@ -9,24 +9,174 @@ WARNING: This script is for educational purposes only. Always respect robots.txt
 website terms of service when scraping.
 """
 
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+from concurrent.futures import Executor
+import httpx
+import jinja2
+import orjson
+from markupsafe import Markup
+from selectolax.lexbor import LexborHTMLParser
 import time
 import random
-import json
-from datetime import datetime
-from typing import List, Dict, Optional
+import re
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Iterator, List, Dict, Optional, Sequence, Tuple
 import logging
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Adaptive backoff: delay grows from BACKOFF_BASE up to BACKOFF_BASE * 2**BACKOFF_SCALE
+# as the share of failures in the recent request window approaches 100%
+BACKOFF_BASE = 2.0
+BACKOFF_SCALE = 4
+# Number of consecutive successful requests after which the pre-request delay is skipped
+HEALTHY_STREAK = 5
+# The failure rate is averaged over at least this many requests, so a single early failure
+# on a fresh scraper doesn't count as a 100% failure rate
+MIN_BACKOFF_SAMPLES = 5
+# Longest Retry-After (seconds) we are willing to wait; beyond it the request is abandoned
+MAX_RETRY_AFTER = 60
+
+# Leading whitespace, "Price:" label and dollar sign, stripped in one pass by clean_price
+PRICE_PREFIX_PATTERN = re.compile(r'^\s*(?:Price:\s*)?\$?\s*')
+
+# Retry-After delta-seconds: a non-negative ASCII integer (RFC 9110)
+DELTA_SECONDS_PATTERN = re.compile(r'[0-9]+')
+
+# Realistic browser headers sent with every request; User-Agent and Referer are rotated per request
+DEFAULT_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Cache-Control': 'max-age=0'
+}
+
+HTTP_TIMEOUT = 30
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+
+# How long (seconds) scraped search results are reused, and how many searches are kept
+SEARCH_CACHE_TTL = 600
+SEARCH_CACHE_SIZE = 256
+
+class SearchCache:
+    """In-memory LRU cache of scraped search results that expire after a fixed TTL."""
+
+    def __init__(self, ttl: float = SEARCH_CACHE_TTL, max_entries: int = SEARCH_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, Tuple[float, List[Dict[str, str]]]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[List[Dict[str, str]]]:
+        """Return cached products for key, or None if missing or expired."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, products = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self.entries[key]
+            return None
+        
+        self.entries.move_to_end(key)
+        return list(products)
+
+    def set(self, key: str, products: List[Dict[str, str]]):
+        """Store products for key, evicting the least recently used entries beyond the size limit."""
+        self.entries[key] = (time.monotonic(), list(products))
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
 class AmazonScraper:
-    def __init__(self):
-        """Initialize the Amazon scraper with configuration."""
-        self.base_url = "https://www.amazon.in"
-        self.session = requests.Session()
+    # Selectors for Amazon search result containers, tried in order until one yields products
+    PRODUCT_SELECTORS = (
+        '[data-component-type="s-search-result"]',  # Primary search results
+        '[data-cel-widget*="search_result"]',  # Widget-based results
+        '.s-result-item:not([data-component-type="s-search-result"])',  # Fallback result items
+    )
+    
+    # Per-field selectors within a container, in priority order. They are tried one at a
+    # time on purpose: a comma-joined union returns the earliest match in document order,
+    # which can rank a lower-priority ancestor or sibling (e.g. the ₹-prefixed .a-offscreen
+    # before .a-price-whole) ahead of the intended element.
+    NAME_SELECTORS = (
+        'h2.a-size-mini span',
+        'h2 a span',
+        '.a-size-base-plus',
+        '.a-size-medium',
+        'h2.s-size-mini span',
+        '[data-cy="title-recipe-title"]',
+        '.a-size-mini span',
+        'h3 a span',
+        '.s-size-mini span'
+    )
+    
+    PRICE_SELECTORS = (
+        '.a-price.a-text-price.a-size-medium.a-color-base .a-offscreen',
+        '.a-price-whole',
+        '.a-price .a-offscreen',
+        '.a-price-symbol',
+        '.a-price-range .a-offscreen',
+        '.a-price-range',
+        '[data-a-size="xl"] .a-offscreen',
+        '.a-price.a-text-price .a-offscreen'
+    )
+    
+    LINK_SELECTORS = (
+        'h2.a-size-mini a',
+        'h2 a',
+        '[data-cy="title-recipe-title"] a',
+        '.a-link-normal[href*="/dp/"]',
+        'a[href*="/dp/"]',
+        '.a-link-normal'
+    )
+    
+    IMG_SELECTORS = (
+        '.s-image',
+        '.a-dynamic-image',
+        'img[data-src*="amazon"]',
+        'img[src*="amazon"]',
+        'img[data-src]',
+        '.rush-component img'
+    )
+
+    def __init__(self, base_url: str = "https://www.amazon.in", client: Optional[httpx.Client] = None):
+        """
+        Initialize the Amazon scraper with configuration.
+        
+        A caller-supplied client is shared, not owned: close() leaves it open.
+        """
+        self.base_url = base_url
+        self.owns_client = client is None
+        self.client = self.create_client() if client is None else client
+        
+        # Request pieces fixed for this domain, built once instead of on every search
+        self.search_url_prefix = f"{base_url}/s?k="
+        self.referers = (
+            'https://www.google.com/',
+            'https://www.bing.com/',
+            'https://duckduckgo.com/',
+            f"{base_url}/"
+        )
+        self.headers_skeleton = {
+            'Origin': base_url,
+            'DNT': '1',
+            'Sec-GPC': '1'
+        }
+        
+        # Sliding window of recent request outcomes (True = 200 OK) used to adapt backoff
+        self.recent_results = deque(maxlen=20)
+        
+        # Recently scraped searches keyed by URL, so repeat queries skip the network entirely
+        self.search_cache = SearchCache()
         
         # Search terms to try if one fails
         self.search_terms = [
@@ -47,74 +197,115 @@ class AmazonScraper:
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0",
             "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         ]
-        
-        # Configure session with realistic settings
-        self.session.headers.update({
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Cache-Control': 'max-age=0'
-        })
+
+    @staticmethod
+    def create_client() -> httpx.Client:
+        """Create an HTTP/2 client that multiplexes requests to a host over one pooled connection."""
+        return httpx.Client(http2=True, headers=DEFAULT_HEADERS, timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+
+    def close(self):
+        """Close the HTTP client if this scraper created it."""
+        if self.owns_client:
+            self.client.close()
 
     def get_random_headers(self) -> Dict[str, str]:
         """Generate random realistic headers to mimic human browsing."""
-        headers = {
-            'User-Agent': random.choice(self.user_agents),
-            'Referer': random.choice([
-                'https://www.google.com/',
-                'https://www.bing.com/',
-                'https://duckduckgo.com/',
-                'https://www.amazon.in/'
-            ]),
-            'Origin': 'https://www.amazon.in',
-            'DNT': '1',
-            'Sec-GPC': '1'
-        }
+        headers = self.headers_skeleton.copy()
+        headers['User-Agent'] = random.choice(self.user_agents)
+        headers['Referer'] = random.choice(self.referers)
         return headers
 
-    def human_delay(self, min_delay: float = 1.0, max_delay: float = 3.0):
-        """Introduce random delays to simulate human browsing patterns."""
-        delay = random.uniform(min_delay, max_delay)
+    def wait(self, delay: float):
+        """Sleep for the given number of seconds."""
         logger.info(f"Waiting {delay:.2f} seconds...")
         time.sleep(delay)
 
-    def make_request(self, url: str, retries: int = 3) -> Optional[requests.Response]:
+    def human_delay(self, min_delay: float = 1.0, max_delay: float = 3.0):
+        """Introduce random delays to simulate human browsing patterns."""
+        self.wait(random.uniform(min_delay, max_delay))
+
+    def record_result(self, success: bool):
+        """Remember the outcome of a request for adaptive backoff."""
+        self.recent_results.append(success)
+
+    def is_healthy(self) -> bool:
+        """Return True when the last few requests all succeeded."""
+        if len(self.recent_results) < HEALTHY_STREAK:
+            return False
+        return all(list(self.recent_results)[-HEALTHY_STREAK:])
+
+    def parse_retry_after(self, retry_after: str) -> Optional[float]:
+        """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds, or None if malformed."""
+        retry_after = retry_after.strip()
+        if DELTA_SECONDS_PATTERN.fullmatch(retry_after):
+            return float(retry_after)
+        
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError, OverflowError):
+            logger.warning(f"Ignoring malformed Retry-After header: {retry_after}")
+            return None
+
+    def get_backoff_delay(self, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        Pick a retry delay, honouring Retry-After and otherwise scaling with the recent failure rate.
+        
+        Returns None when the server asks for a wait longer than MAX_RETRY_AFTER, meaning give up.
+        """
+        if retry_after:
+            delay = self.parse_retry_after(retry_after)
+            if delay is not None:
+                if delay > MAX_RETRY_AFTER:
+                    logger.warning(f"Retry-After of {delay:.0f}s exceeds {MAX_RETRY_AFTER}s, giving up")
+                    return None
+                return delay
+        
+        samples = max(len(self.recent_results), MIN_BACKOFF_SAMPLES)
+        failure_rate = self.recent_results.count(False) / samples
+        delay = BACKOFF_BASE * 2 ** (failure_rate * BACKOFF_SCALE)
+        
+        # Equal jitter (a random point in the upper half) keeps concurrent retries from lining up
+        return random.uniform(delay / 2, delay)
+
+    def make_request(self, url: str, retries: int = 3) -> Optional[httpx.Response]:
         """Make HTTP request with error handling and retry logic."""
         for attempt in range(retries):
+            retry_after = None
             try:
-                # Update headers for each request
-                self.session.headers.update(self.get_random_headers())
-                
-                # Add initial delay before request
-                if attempt == 0:
+                # Skip the initial delay while the host is answering cleanly
+                if attempt == 0 and not self.is_healthy():
                     self.human_delay(2.0, 5.0)
-                else:
-                    self.human_delay(5.0, 10.0)  # Longer delay for retries
                 
                 logger.info(f"Making request to {url} (attempt {attempt + 1})")
-                response = self.session.get(url, timeout=30)
+                response = self.client.get(url, headers=self.get_random_headers())
+                self.record_result(response.status_code == 200)
                 
                 if response.status_code == 200:
                     return response
-                elif response.status_code == 429:
-                    logger.warning("Rate limited, waiting longer...")
-                    self.human_delay(10.0, 20.0)
+                elif response.status_code in (429, 503):
+                    logger.warning(f"Throttled with status {response.status_code}, backing off...")
+                    retry_after = response.headers.get('Retry-After')
                 else:
                     logger.warning(f"Request failed with status {response.status_code}")
                     
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
+                self.record_result(False)
                 logger.error(f"Request error on attempt {attempt + 1}: {e}")
-                if attempt < retries - 1:
-                    self.human_delay(5.0, 10.0)
+            
+            if attempt < retries - 1:
+                delay = self.get_backoff_delay(retry_after)
+                if delay is None:
+                    break
+                self.wait(delay)
         
         return None
 
-    def parse_product_data(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def extract_products(self, content: bytes) -> List[Dict[str, str]]:
+        """Parse raw page bytes and extract product data from them."""
+        return self.parse_product_data(LexborHTMLParser(content))
+
+    def parse_product_data(self, tree: LexborHTMLParser) -> List[Dict[str, str]]:
         """
         Parse product data from Amazon search results.
         
@@ -123,17 +314,8 @@ class AmazonScraper:
         """
         products = []
         
-        # Updated selectors for Amazon search results (more likely to work)
-        product_selectors = [
-            '[data-component-type="s-search-result"]',  # Primary search results
-            '[data-asin][data-component-type="s-search-result"]',  # More specific search results
-            '.s-result-item[data-component-type="s-search-result"]',  # Alternative format
-            '[data-cel-widget*="search_result"]',  # Widget-based results
-            '.s-result-item:not([data-component-type="s-search-result"])',  # Fallback result items
-        ]
-        
-        for selector in product_selectors:
-            containers = soup.select(selector)
+        for selector in self.PRODUCT_SELECTORS:
+            containers = tree.css(selector)
             logger.info(f"Found {len(containers)} products with selector: {selector}")
             
             for container in containers[:20]:  # Limit to first 20 products
@@ -141,8 +323,6 @@ class AmazonScraper:
                     product = self.extract_product_info(container)
                     if product and product.get('productName'):  # Only require name to be present
                         products.append(product)
-                        # Small delay between processing products
-                        self.human_delay(0.1, 0.5)
                         
                 except Exception as e:
                     logger.warning(f"Error parsing product: {e}")
@@ -158,66 +338,25 @@ class AmazonScraper:
         """Extract individual product information from a container element."""
         product = {}
         
-        # Extract product name - updated selectors for current Amazon structure
-        name_selectors = [
-            'h2.a-size-mini span',
-            'h2 a span',
-            '.a-size-base-plus',
-            '.a-size-medium',
-            'h2.s-size-mini span',
-            '[data-cy="title-recipe-title"]',
-            '.a-size-mini span',
-            'h3 a span',
-            '.s-size-mini span'
-        ]
-        
-        product['productName'] = self.find_text_by_selectors(container, name_selectors)
-        
-        # Extract price - updated selectors for current Amazon structure
-        price_selectors = [
-            '.a-price.a-text-price.a-size-medium.a-color-base .a-offscreen',
-            '.a-price-whole',
-            '.a-price .a-offscreen',
-            '.a-price-symbol',
-            '.a-price-range .a-offscreen',
-            '.a-price-range',
-            '[data-a-size="xl"] .a-offscreen',
-            '.a-price.a-text-price .a-offscreen'
-        ]
+        # Extract product name
+        product['productName'] = self.find_text_by_selectors(container, self.NAME_SELECTORS)
         
-        price_text = self.find_text_by_selectors(container, price_selectors)
+        # Extract price
+        price_text = self.find_text_by_selectors(container, self.PRICE_SELECTORS)
         product['price'] = self.clean_price(price_text) if price_text else "Price not available"
         
-        # Extract product link - updated selectors for current Amazon structure
-        link_selectors = [
-            'h2.a-size-mini a',
-            'h2 a',
-            '[data-cy="title-recipe-title"] a',
-            '.a-link-normal[href*="/dp/"]',
-            'a[href*="/dp/"]',
-            '.a-link-normal'
-        ]
-        
-        link_element = self.find_element_by_selectors(container, link_selectors)
-        if link_element and link_element.get('href'):
-            href = link_element['href']
-            product['link'] = href if href.startswith('http') else f"https://www.amazon.in{href}"
+        # Extract product link
+        link_element = self.find_element_by_selectors(container, self.LINK_SELECTORS)
+        href = link_element.attrs.get('href') if link_element else None
+        if href:
+            product['link'] = href if href.startswith('http') else f"{self.base_url}{href}"
         else:
             product['link'] = ""
         
-        # Extract image URL - updated selectors for current Amazon structure
-        img_selectors = [
-            '.s-image',
-            '.a-dynamic-image',
-            'img[data-src*="amazon"]',
-            'img[src*="amazon"]',
-            'img[data-src]',
-            '.rush-component img'
-        ]
-        
-        img_element = self.find_element_by_selectors(container, img_selectors)
+        # Extract image URL
+        img_element = self.find_element_by_selectors(container, self.IMG_SELECTORS)
         if img_element:
-            product['image_url'] = img_element.get('src') or img_element.get('data-src', '')
+            product['image_url'] = img_element.attrs.get('src') or img_element.attrs.get('data-src') or ''
         else:
             product['image_url'] = ""
         
@@ -228,20 +367,28 @@ class AmazonScraper:
         
         return None
 
-    def find_text_by_selectors(self, container, selectors: List[str]) -> Optional[str]:
+    def select_descendant(self, container, selector: str):
+        """Return the first descendant matching selector, like BeautifulSoup's select_one."""
+        # lexbor's css() also tests the container itself, so a broad selector could match the wrapper
+        for element in container.css(selector):
+            if element != container:
+                return element
+        return None
+
+    def find_text_by_selectors(self, container, selectors: Sequence[str]) -> Optional[str]:
         """Find text content using multiple selectors."""
         for selector in selectors:
-            element = container.select_one(selector)
+            element = self.select_descendant(container, selector)
             if element:
-                text = element.get_text(strip=True)
+                text = element.text(strip=True)
                 if text:
                     return text
         return None
 
-    def find_element_by_selectors(self, container, selectors: List[str]):
+    def find_element_by_selectors(self, container, selectors: Sequence[str]):
         """Find element using multiple selectors."""
         for selector in selectors:
-            element = container.select_one(selector)
+            element = self.select_descendant(container, selector)
             if element:
                 return element
         return None
@@ -251,22 +398,22 @@ class AmazonScraper:
         if not price_text:
             return "Price not available"
         
-        # Remove extra whitespace and common price prefixes
-        price_text = price_text.strip()
-        price_text = price_text.replace('$', '$').replace('Price:', '').strip()
+        # Strip common prefixes, then normalise to a single leading $
+        price_text = PRICE_PREFIX_PATTERN.sub('', price_text, count=1).strip()
         
-        # If price doesn't start with $, add it
-        if price_text and not price_text.startswith('$'):
-            price_text = f"${price_text}"
-        
-        return price_text if price_text else "Price not available"
+        return f"${price_text}" if price_text else "Price not available"
 
     def scrape_amazon_search(self, search_term: str = "electronics") -> List[Dict[str, str]]:
         """Main method to scrape Amazon search results for product data."""
         logger.info(f"Starting Amazon search scraping for: {search_term}")
         
         # Construct search URL
-        search_url = f"{self.base_url}/s?k={search_term}&ref=sr_pg_1"
+        search_url = f"{self.search_url_prefix}{search_term}&ref=sr_pg_1"
+        
+        cached = self.search_cache.get(search_url)
+        if cached is not None:
+            logger.info(f"Using cached results for '{search_term}'")
+            return cached
         
         # Make request to Amazon search page
         response = self.make_request(search_url)
@@ -274,11 +421,10 @@ class AmazonScraper:
             logger.error(f"Failed to fetch Amazon search results for: {search_term}")
             return []
         
-        # Parse HTML content
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Extract product data
-        products = self.parse_product_data(soup)
+        # Parse HTML content and extract product data
+        products = self.extract_products(response.content)
+        if products:
+            self.search_cache.set(search_url, products)
         
         logger.info(f"Scraping completed for '{search_term}'. Found {len(products)} products.")
         return products
@@ -301,10 +447,119 @@ class AmazonScraper:
         
         return all_products
 
-def generate_html_page(products: List[Dict[str, str]], output_file: str = "amazon_products.html"):
-    """Generate a responsive HTML page with scraped product data using Tailwind CSS."""
+class AsyncAmazonScraper(AmazonScraper):
+    """
+    Asyncio variant of AmazonScraper backed by an httpx.AsyncClient.
     
-    html_template = f"""<!DOCTYPE html>
+    Network I/O and delays are awaited, so several searches can overlap their round
+    trips instead of running back to back. Parsing is CPU-bound and runs on an
+    executor (the loop's default thread pool unless one is given) to keep the event
+    loop free while a page is processed.
+    """
+
+    def __init__(self, base_url: str = "https://www.amazon.in", client: Optional[httpx.AsyncClient] = None,
+                 executor: Optional[Executor] = None):
+        super().__init__(base_url, client)
+        self.executor = executor
+
+    @staticmethod
+    def create_client() -> httpx.AsyncClient:
+        """Create an async HTTP/2 client that multiplexes requests to a host over one pooled connection."""
+        return httpx.AsyncClient(http2=True, headers=DEFAULT_HEADERS, timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+
+    async def close(self):
+        """Close the HTTP client if this scraper created it."""
+        if self.owns_client:
+            await self.client.aclose()
+
+    async def wait(self, delay: float):
+        """Sleep for the given number of seconds without blocking the event loop."""
+        logger.info(f"Waiting {delay:.2f} seconds...")
+        await asyncio.sleep(delay)
+
+    async def human_delay(self, min_delay: float = 1.0, max_delay: float = 3.0):
+        """Introduce random delays without blocking the event loop."""
+        await self.wait(random.uniform(min_delay, max_delay))
+
+    async def make_request(self, url: str, retries: int = 3) -> Optional[httpx.Response]:
+        """Make HTTP request with error handling and retry logic."""
+        for attempt in range(retries):
+            retry_after = None
+            try:
+                # Skip the initial delay while the host is answering cleanly
+                if attempt == 0 and not self.is_healthy():
+                    await self.human_delay(2.0, 5.0)
+                
+                logger.info(f"Making request to {url} (attempt {attempt + 1})")
+                response = await self.client.get(url, headers=self.get_random_headers())
+                self.record_result(response.status_code == 200)
+                
+                if response.status_code == 200:
+                    return response
+                elif response.status_code in (429, 503):
+                    logger.warning(f"Throttled with status {response.status_code}, backing off...")
+                    retry_after = response.headers.get('Retry-After')
+                else:
+                    logger.warning(f"Request failed with status {response.status_code}")
+                    
+            except httpx.HTTPError as e:
+                self.record_result(False)
+                logger.error(f"Request error on attempt {attempt + 1}: {e}")
+            
+            if attempt < retries - 1:
+                delay = self.get_backoff_delay(retry_after)
+                if delay is None:
+                    break
+                await self.wait(delay)
+        
+        return None
+
+    async def scrape_amazon_search(self, search_term: str = "electronics") -> List[Dict[str, str]]:
+        """Scrape Amazon search results for product data without blocking the event loop."""
+        logger.info(f"Starting Amazon search scraping for: {search_term}")
+        
+        search_url = f"{self.search_url_prefix}{search_term}&ref=sr_pg_1"
+        
+        cached = self.search_cache.get(search_url)
+        if cached is not None:
+            logger.info(f"Using cached results for '{search_term}'")
+            return cached
+        
+        response = await self.make_request(search_url)
+        if not response:
+            logger.error(f"Failed to fetch Amazon search results for: {search_term}")
+            return []
+        
+        loop = asyncio.get_running_loop()
+        products = await loop.run_in_executor(self.executor, self.extract_products, response.content)
+        if products:
+            self.search_cache.set(search_url, products)
+        
+        logger.info(f"Scraping completed for '{search_term}'. Found {len(products)} products.")
+        return products
+
+    async def scrape_with_fallback(self) -> List[Dict[str, str]]:
+        """Try multiple search terms until we find products."""
+        # Terms are tried one at a time, as in the sync scraper: firing them all at once
+        # would send every fallback search to Amazon even when the first one succeeds
+        for search_term in self.search_terms:
+            logger.info(f"Trying search term: {search_term}")
+            products = await self.scrape_amazon_search(search_term)
+            
+            if products:
+                logger.info(f"Success with '{search_term}': {len(products)} products found")
+                return products
+            logger.warning(f"No products found for '{search_term}', trying next term...")
+            await self.human_delay(3.0, 7.0)  # Wait before trying next term
+        
+        return []
+
+PLACEHOLDER_IMAGE_URL = 'https://via.placeholder.com/300x300/f0f0f0/999999?text=No+Image'
+
+# Templates are compiled once at import; autoescaping keeps scraped text from injecting markup
+template_env = jinja2.Environment(autoescape=True)
+
+PAGE_TEMPLATE = template_env.from_string("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -312,29 +567,29 @@ def generate_html_page(products: List[Dict[str, str]], output_file: str = "amazo
     <title>Amazon Products - Scraped Data</title>
     <script src="https://cdn.tailwindcss.com"></script>
     <style>
-        .product-card {{
+        .product-card {
             transition: transform 0.3s ease, box-shadow 0.3s ease;
-        }}
-        .product-card:hover {{
+        }
+        .product-card:hover {
             transform: translateY(-5px);
             box-shadow: 0 10px 25px rgba(0, 0, 0, 0.1);
-        }}
-        .product-image {{
+        }
+        .product-image {
             aspect-ratio: 1;
             object-fit: cover;
-        }}
+        }
     </style>
 </head>
 <body class="bg-gray-50 min-h-screen">
     <div class="container mx-auto px-4 py-8">
         <header class="text-center mb-12">
             <h1 class="text-4xl font-bold text-gray-800 mb-4">Amazon Products</h1>
-            <p class="text-gray-600 text-lg">Scraped on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</p>
-            <p class="text-gray-500 text-sm mt-2">Found {len(products)} products</p>
+            <p class="text-gray-600 text-lg">Scraped on {{ scraped_at }}</p>
+            <p class="text-gray-500 text-sm mt-2">Found {{ product_count }} products</p>
         </header>
         
         <div class="grid grid-cols-1 sm:grid-cols-2 md:grid-cols-3 lg:grid-cols-4 xl:grid-cols-5 gap-6">
-            {generate_product_cards(products)}
+            {% for card in cards %}{{ card }}{% endfor %}
         </div>
         
         <footer class="mt-16 text-center text-gray-500 text-sm">
@@ -343,48 +598,68 @@ def generate_html_page(products: List[Dict[str, str]], output_file: str = "amazo
         </footer>
     </div>
 </body>
-</html>"""
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_template)
-    
-    logger.info(f"HTML page generated: {output_file}")
+</html>""")
 
-def generate_product_cards(products: List[Dict[str, str]]) -> str:
-    """Generate HTML cards for each product."""
-    cards = []
-    
-    for i, product in enumerate(products):
-        # Fallback image if none provided
-        image_url = product.get('image_url', '') or 'https://via.placeholder.com/300x300/f0f0f0/999999?text=No+Image'
-        
-        card_html = f"""
+CARD_TEMPLATE = template_env.from_string("""
         <div class="product-card bg-white rounded-lg shadow-md overflow-hidden">
             <div class="aspect-square bg-gray-100 flex items-center justify-center">
-                <img src="{image_url}" 
-                     alt="{product.get('productName', 'Product')}" 
+                <img src="{{ image_url }}" 
+                     alt="{{ product.get('productName', 'Product') }}" 
                      class="product-image w-full h-full object-contain"
-                     onerror="this.src='https://via.placeholder.com/300x300/f0f0f0/999999?text=No+Image'">
+                     onerror="this.src='{{ placeholder_url }}'">
             </div>
             <div class="p-4">
                 <h3 class="font-semibold text-sm text-gray-800 mb-2 line-clamp-2 h-10 overflow-hidden">
-                    {product.get('productName', 'Product Name Not Available')[:100]}{'...' if len(product.get('productName', '')) > 100 else ''}
+                    {{ truncated_name }}
                 </h3>
                 <p class="text-lg font-bold text-green-600 mb-3">
-                    {product.get('price', 'Price not available')}
+                    {{ product.get('price', 'Price not available') }}
                 </p>
-                <a href="{product.get('link', '#')}" 
+                <a href="{{ product.get('link', '#') }}" 
                    target="_blank" 
                    class="block w-full bg-blue-600 hover:bg-blue-700 text-white text-center py-2 px-4 rounded-md text-sm font-medium transition-colors duration-200"
-                   {'style="pointer-events: none; opacity: 0.5;"' if not product.get('link') else ''}>
+                   {% if not product.get('link') %}style="pointer-events: none; opacity: 0.5;"{% endif %}>
                     View Product
                 </a>
             </div>
-        </div>"""
-        
-        cards.append(card_html)
+        </div>""")
+
+def generate_html_page(products: List[Dict[str, str]], output_file: str = "amazon_products.html"):
+    """Generate a responsive HTML page with scraped product data using Tailwind CSS."""
+    
+    html_stream = PAGE_TEMPLATE.stream(
+        scraped_at=datetime.now().strftime('%B %d, %Y at %I:%M %p'),
+        product_count=len(products),
+        cards=generate_product_cards(products)
+    )
     
-    return '\n'.join(cards)
+    # Cards are rendered lazily and streamed through a large buffer instead of joined in memory
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        html_stream.dump(f)
+    
+    logger.info(f"HTML page generated: {output_file}")
+
+def render_product_card(product: Dict[str, str]) -> str:
+    """Render the HTML card for a single product."""
+    name = product.get('productName', 'Product Name Not Available')
+    
+    return CARD_TEMPLATE.render(
+        product=product,
+        # Fallback image if none provided
+        image_url=product.get('image_url', '') or PLACEHOLDER_IMAGE_URL,
+        placeholder_url=PLACEHOLDER_IMAGE_URL,
+        truncated_name=f"{name[:100]}..." if len(name) > 100 else name
+    )
+
+def generate_product_cards(products: Iterable[Dict[str, str]]) -> Iterator[Markup]:
+    """Generate HTML cards for each product."""
+    for product in products:
+        yield Markup(render_product_card(product))
+
+def save_products_json(products: List[Dict[str, str]], output_file: str):
+    """Save scraped products as indented UTF-8 JSON."""
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(products, option=orjson.OPT_INDENT_2))
 
 def main():
     """Main function to demonstrate the scraper usage."""
@@ -407,8 +682,7 @@ def main():
         generate_html_page(products)
         
         # Save data as JSON for debugging
-        with open('scraped_products.json', 'w', encoding='utf-8') as f:
-            json.dump(products, f, indent=2, ensure_ascii=False)
+        save_products_json(products, 'scraped_products.json')
         
         print("Files generated:")
         print("- amazon_products.html (responsive webpage)")
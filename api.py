@@ -1,9 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
-from amazon_scraper import AmazonScraper
+from amazon_scraper import AsyncAmazonScraper
 from typing import List, Dict, Optional
+import httpx
 
-app = FastAPI()
+country_domains = {
+    "US": "https://www.amazon.com",
+    "UK": "https://www.amazon.co.uk",
+    "CA": "https://www.amazon.ca",
+    "IN": "https://www.amazon.in",
+    # Add more country domains as needed
+}
+
+# One long-lived scraper per country, all sharing one client so connections are reused across API calls
+# and one parse pool so page parsing never blocks the event loop. They are built on first use rather than
+# in a startup hook, since serverless runtimes may never send the ASGI lifespan events.
+scraper_pool: Dict[str, AsyncAmazonScraper] = {}
+shared_client: Optional[httpx.AsyncClient] = None
+parse_pool: Optional[ThreadPoolExecutor] = None
+
+def get_scraper(country: str) -> Optional[AsyncAmazonScraper]:
+    """Return the scraper for a country code, creating it (and the shared client and pool) if needed."""
+    global shared_client, parse_pool
+    scraper = scraper_pool.get(country)
+    if scraper is None and country in country_domains:
+        if shared_client is None:
+            shared_client = AsyncAmazonScraper.create_client()
+        if parse_pool is None:
+            parse_pool = ThreadPoolExecutor(max_workers=16)
+        scraper = AsyncAmazonScraper(base_url=country_domains[country], client=shared_client, executor=parse_pool)
+        scraper_pool[country] = scraper
+    return scraper
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Only runs where the server sends lifespan shutdown; elsewhere the process just exits
+    global shared_client, parse_pool
+    scraper_pool.clear()
+    if shared_client is not None:
+        await shared_client.aclose()
+        shared_client = None
+    if parse_pool is not None:
+        parse_pool.shutdown(wait=False)
+        parse_pool = None
+
+app = FastAPI(lifespan=lifespan)
 
 class SearchRequest(BaseModel):
     country: str
@@ -12,25 +56,13 @@ class SearchRequest(BaseModel):
 @app.post("/api/search")
 async def search_products(request: SearchRequest) -> List[Dict[str, str]]:
     try:
-        # Initialize scraper
-        scraper = AmazonScraper()
-        
-        # Update base URL based on country
-        country_domains = {
-            "US": "https://www.amazon.com",
-            "UK": "https://www.amazon.co.uk",
-            "CA": "https://www.amazon.ca",
-            "IN": "https://www.amazon.in",
-            # Add more country domains as needed
-        }
+        scraper = get_scraper(request.country)
         
-        if request.country not in country_domains:
+        if scraper is None:
             raise HTTPException(status_code=400, detail=f"Unsupported country code: {request.country}")
         
-        scraper.base_url = country_domains[request.country]
-        
         # Search for products
-        products = scraper.scrape_amazon_search(request.query)
+        products = await scraper.scrape_amazon_search(request.query)
         
         if not products:
             return []
@@ -43,4 +75,4 @@ async def search_products(request: SearchRequest) -> List[Dict[str, str]]:
 # For local development
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=8000) 
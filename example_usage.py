@@ -6,8 +6,7 @@ This file demonstrates how to use the scraper to search for products on Amazon.
 Simply modify the variables below and run the script.
 """
 
-from amazon_scraper import AmazonScraper, generate_html_page
-import json
+from amazon_scraper import AmazonScraper, generate_html_page, save_products_json
 
 def main():
     # ========================================
@@ -41,8 +40,7 @@ def main():
     
     # Save detailed results
     output_file = "search_results.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(products, f, indent=2, ensure_ascii=False)
+    save_products_json(products, output_file)
     
     print(f"💾 Detailed results saved to: {output_file}")
     